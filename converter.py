@@ -1,8 +1,16 @@
 # Standard library imports
+import datetime
+import math
+import os
 import pathlib
 import numbers
-from typing import Any, List, Set
+import re
+import sys
+import zipfile
+from typing import IO, Any, Dict, List, Optional, Union
+from xml.sax.saxutils import escape
 
+import numpy as np
 import pandas as pd
 
 
@@ -43,6 +51,9 @@ SHOPIFY_COLUMNS = [
     "Google Shopping / Google Product Category",
 ]
 
+# shopify_to_ikas_stream'in bir seferde dönüştürdüğü Handle sayısı
+HANDLES_PER_CHUNK = 1000
+
 # ikas sütun yapısı (kullanıcının belirttiği TAM VE KESİN liste - 37 sütun)
 def normalize_google_category_value(value: Any) -> str:
     """Convert Google category values into normalized strings."""
@@ -59,8 +70,14 @@ def normalize_google_category_value(value: Any) -> str:
 
 
 def order_prices(sale_price: float, discounted_price: float) -> tuple[float, float]:
-    """Ensure the higher value stays in Satış Fiyatı and lower in İndirimli Fiyatı."""
+    """Ensure the higher value stays in Satış Fiyatı and lower in İndirimli Fiyatı.
+
+    pandas Series verilirse satır bazında uygulanır.
+    """
 
+    if isinstance(sale_price, pd.Series):
+        swap = discounted_price > sale_price
+        return sale_price.where(~swap, discounted_price), discounted_price.where(~swap, sale_price)
     if discounted_price > sale_price:
         return discounted_price, sale_price
     return sale_price, discounted_price
@@ -107,12 +124,405 @@ IKAS_COLUMNS_TEMPLATE = [
 ]
 
 
+# Her satırda boş bırakılan ikas sütunları
+EMPTY_COLUMNS_TEMPLATE = [
+    "Varyant ID",
+    "Alış Fiyatı",
+    "Silindi mi?",
+    "Desi",
+    "HS Kod",
+    "Birim Ürün Miktarı",
+    "Ürün Birimi",
+    "Satılan Ürün Miktarı",
+    "Satılan Ürün Birimi",
+    "Stoğu Tükenince Satmaya Devam Et",
+    "Sepet Başına Minimum Alma Adeti:{store_name}",
+    "Sepet Başına Maksimum Alma Adeti:belix",
+    "Varyant Aktiflik",
+]
+
+
+# Handle başına ilk boş olmayan değeri ortak bilgi olarak kullanılan Shopify sütunları
+COMMON_INFO_COLUMNS = [
+    "Title",
+    "Body (HTML)",
+    "Vendor",
+    "Type",
+    "Product Category",
+    "Tags",
+    "SEO Title",
+    "SEO Description",
+    "Created At",
+    "Google Shopping / Google Product Category",
+    "Google Product Category",
+]
+
+# Satır bazında okunan Shopify sütunları (varyant anahtarı, SKU/barkod, fiyat, stok ve görseller)
+VARIANT_ROW_COLUMNS = [
+    "Option1 Name",
+    "Option1 Value",
+    "Option2 Name",
+    "Option2 Value",
+    "Variant SKU",
+    "Variant Barcode",
+    "Barcode",
+    "Variant Price",
+    "Compare At Price",
+    "Variant Compare At Price",
+    "Variant Inventory Qty",
+    "Image Src",
+    "Variant Image",
+]
+
+# Dönüşümde okunan sütunlar; dosyadaki diğer sütunlar (ör. Option3, Variant Grams) hiç ayrıştırılmaz
+USED_COLUMNS = frozenset(["Handle"] + COMMON_INFO_COLUMNS + VARIANT_ROW_COLUMNS)
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """Convert non-null values with str() and fill missing ones with an empty string."""
+
+    return series.dropna().astype(str).reindex(series.index, fill_value="")
+
+
+def _fill_empty(series: pd.Series) -> pd.Series:
+    # Eksik değerleri "" yap; fillna("") datetime64 gibi tiplerde sessizce etkisiz kalır
+    return series.astype(object).where(series.notna(), "")
+
+
+def _column_or_empty(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column in frame.columns:
+        return frame[column]
+    return pd.Series(np.nan, index=frame.index, dtype=object)
+
+
+def _coalesce(first: pd.Series, second: pd.Series) -> pd.Series:
+    # Satır bazında: ilk sütun boşsa ikinci sütunun değerini kullan.
+    # object tipte birleştirilir; yoksa boş (float64) ilk sütun int64 değerleri float'a çevirir ("….0")
+    return first.astype(object).where(first.notna(), second.astype(object))
+
+
+def _first_nonzero(values: pd.Series) -> pd.Series:
+    # Sayıya çevrilemeyen ve sıfır olan değerler atlanır; döngüdeki "0 ise sonraki satıra bak" kuralı
+    numbers = pd.to_numeric(values, errors="coerce")
+    return numbers.where(numbers != 0)
+
+
+def _variant_value_candidates(frame: pd.DataFrame) -> pd.DataFrame:
+    """Prepare per-row SKU, barcode, price, compare-at price and stock candidates once.
+
+    Barkod ve karşılaştırma fiyatı için yedek sütunlar satır bazında birleştirilir,
+    sayısal alanlar sayıya çevrilir; sıfır ve geçersiz değerler boş (NaN) olur.
+    """
+
+    return pd.DataFrame(
+        {
+            "SKU": _column_or_empty(frame, "Variant SKU"),
+            # Barkod: önce Variant Barcode, yoksa aynı satırdaki Barcode
+            "Barcode": _coalesce(_column_or_empty(frame, "Variant Barcode"), _column_or_empty(frame, "Barcode")),
+            "Price": _first_nonzero(_column_or_empty(frame, "Variant Price")),
+            # Karşılaştırma fiyatı satır bazında birleştirilir, sonra sayıya çevrilir
+            "Compare Price": _first_nonzero(
+                _coalesce(_column_or_empty(frame, "Compare At Price"), _column_or_empty(frame, "Variant Compare At Price"))
+            ),
+            # Stok int() gibi ondalığı atar; sıfır kontrolü kesilmiş değer üzerinden yapılır
+            "Stock": _first_nonzero(
+                np.trunc(pd.to_numeric(_column_or_empty(frame, "Variant Inventory Qty"), errors="coerce"))
+            ),
+        }
+    )
+
+
+def _first_variant_values(
+    candidates: pd.DataFrame, keys: List[pd.Series], skip_rows: Optional[pd.Series] = None
+) -> pd.DataFrame:
+    """Return the first SKU/barcode and first non-zero price, compare-at price and stock per group.
+
+    `candidates` `_variant_value_candidates` çıktısıdır; `skip_rows` işaretli satırlar
+    barkod, fiyat ve stok için dikkate alınmaz.
+    """
+
+    if skip_rows is not None and skip_rows.any():
+        # Barkod object tipte maskelenir; int64 barkodlar float'a dönüp "….0" olarak yazılmasın
+        candidates = candidates.assign(
+            Barcode=candidates["Barcode"].astype(object).mask(skip_rows),
+            **{column: candidates[column].mask(skip_rows) for column in ("Price", "Compare Price", "Stock")},
+        )
+    firsts = candidates.groupby(keys, sort=False, observed=True).first()
+    return pd.DataFrame(
+        {
+            "SKU": _as_text(firsts["SKU"]),
+            "Barcode": _as_text(firsts["Barcode"]),
+            "Price": firsts["Price"].fillna(0.0).astype(float),
+            "Compare Price": firsts["Compare Price"].fillna(0.0).astype(float),
+            "Stock": firsts["Stock"].fillna(0).astype(int),
+        },
+        index=firsts.index,
+    )
+
+
+def _to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Store columns that hold only text as Arrow-backed strings."""
+
+    # Sadece tamamı metin olan sütunlar; karışık tipli sütunlar (ör. tarih + boş metin) object kalır
+    text_columns = {
+        column: "string[pyarrow]"
+        for column in df.columns
+        if df[column].dtype == object and pd.api.types.infer_dtype(df[column], skipna=True) == "string"
+    }
+    return df.astype(text_columns)
+
+
+def _stripped_text(frame: pd.DataFrame, column: str) -> pd.Series:
+    return _as_text(_column_or_empty(frame, column)).str.strip()
+
+
+# Her çıktı satırında ayrı hesaplanan ikas sütunları (diğerleri Handle bilgisinden yayılır)
+ROW_VALUE_COLUMNS = [
+    "Ürün Grup ID",
+    "Satış Fiyatı",
+    "İndirimli Fiyatı",
+    "Barkod Listesi",
+    "SKU",
+    "Slug",
+    "Stok:Ana Depo",
+    "Varyant Tip 1",
+    "Varyant Değer 1",
+    "Varyant Tip 2",
+    "Varyant Değer 2",
+]
+
+
 def build_ikas_columns(store_name: str) -> List[str]:
     normalized_store_name = store_name.strip() if store_name and store_name.strip() else "belix"
     return [column.format(store_name=normalized_store_name) for column in IKAS_COLUMNS_TEMPLATE]
 
 
-def shopify_to_ikas_converter(file_path: str, store_name: str = "belix") -> pd.DataFrame:
+# XLSX paketinin sabit parçaları (stil içermeyen tek sayfalık çalışma kitabı)
+_XLSX_CONTENT_TYPES = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    b'<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    b'<Default Extension="xml" ContentType="application/xml"/>'
+    b'<Override PartName="/xl/workbook.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    b'<Override PartName="/xl/worksheets/sheet1.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    b'<Override PartName="/xl/styles.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    b"</Types>"
+)
+_XLSX_ROOT_RELS = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    b'Target="xl/workbook.xml"/>'
+    b"</Relationships>"
+)
+_XLSX_WORKBOOK_RELS = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    b'Target="worksheets/sheet1.xml"/>'
+    b'<Relationship Id="rId2" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    b'Target="styles.xml"/>'
+    b"</Relationships>"
+)
+# Hücre biçimleri: s="1" başlık satırı (pandas'taki gibi kalın, kenarlıklı, ortalı), s="2" tarih-saat
+_XLSX_STYLES = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    b'<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm:ss"/></numFmts>'
+    b'<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    b'<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    b'<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    b'<fill><patternFill patternType="gray125"/></fill></fills>'
+    b'<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    b'<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/>'
+    b"<diagonal/></border></borders>"
+    b'<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    b'<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    b'<xf numFmtId="0" fontId="1" fillId="0" borderId="1" xfId="0" applyFont="1" applyBorder="1" '
+    b'applyAlignment="1"><alignment horizontal="center" vertical="top"/></xf>'
+    b'<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+    b'<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    b"</styleSheet>"
+)
+_XLSX_SHEET_HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_FOOTER = b"</sheetData></worksheet>"
+
+# Excel hücresine sığan en uzun metin ve XML 1.0'da yazılamayan kontrol karakterleri
+_XLSX_MAX_STRING_LENGTH = 32767
+_XLSX_EPOCH = datetime.datetime(1899, 12, 30)
+_XML_ILLEGAL_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _xlsx_column_letters(count: int) -> List[str]:
+    letters = []
+    for index in range(1, count + 1):
+        name = ""
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            name = chr(65 + remainder) + name
+        letters.append(name)
+    return letters
+
+
+def _xlsx_cell(reference: str, value: Any, style: str = "") -> str:
+    """Render a single `<c>` element; empty values produce no cell at all."""
+
+    if value is None or value == "":
+        return ""
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c r="{reference}"{style} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Number):
+        if not math.isfinite(value):
+            return ""
+        return f'<c r="{reference}"{style}><v>{value}</v></c>'
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        # Tarihler Excel seri numarası olarak, tarih-saat biçimiyle (s="2") yazılır
+        if not isinstance(value, datetime.datetime):
+            value = datetime.datetime.combine(value, datetime.time())
+        serial = (value.replace(tzinfo=None) - _XLSX_EPOCH) / datetime.timedelta(days=1)
+        return f'<c r="{reference}" s="2"><v>{serial}</v></c>'
+    text = str(value)[:_XLSX_MAX_STRING_LENGTH]
+    text = _XML_ILLEGAL_CHARS.sub(lambda match: f"_x{ord(match.group()):04X}_", escape(text))
+    return f'<c r="{reference}"{style} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def write_xlsx(df: pd.DataFrame, target: IO[bytes], sheet_name: str = "ikas_products") -> None:
+    """Write `df` as a single-sheet XLSX workbook into the binary stream `target`.
+
+    Sayfa XML'i, xlsxwriter'ın nesne modeli kurulmadan satır satır doğrudan ZIP girdisine
+    yazılır; arşiv en hızlı Deflate seviyesiyle (1) sıkıştırılır. Başlık satırı kalın yazılır,
+    metinler satır içi (inlineStr) saklanır, boş ve NaN hücreler atlanır.
+    """
+
+    letters = _xlsx_column_letters(len(df.columns))
+    workbook_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{escape(sheet_name, {chr(34): "&quot;"})}" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ).encode("utf-8")
+
+    rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        archive.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        archive.writestr("xl/workbook.xml", workbook_xml)
+        archive.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        archive.writestr("xl/styles.xml", _XLSX_STYLES)
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_XLSX_SHEET_HEADER)
+            header_cells = "".join(
+                _xlsx_cell(f"{letter}1", column, ' s="1"') for letter, column in zip(letters, df.columns)
+            )
+            sheet.write(f'<row r="1">{header_cells}</row>'.encode("utf-8"))
+            for row_number, row in enumerate(rows, start=2):
+                cells = "".join(
+                    _xlsx_cell(f"{letter}{row_number}", value) for letter, value in zip(letters, row)
+                )
+                sheet.write(f'<row r="{row_number}">{cells}</row>'.encode("utf-8"))
+            sheet.write(_XLSX_SHEET_FOOTER)
+
+
+def _rewind(source: Any) -> None:
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+
+def _read_csv(source: Any, engine: str) -> pd.DataFrame:
+    """Read the converter's columns from a CSV export, falling back to the C parser if needed."""
+
+    # pyarrow motoru usecols için çağrılabilir kabul etmiyor ve eksik sütunda hata veriyor;
+    # bu yüzden önce başlık okunur, dosyada bulunan gerekli sütunlar liste olarak verilir
+    header = pd.read_csv(source, nrows=0).columns
+    _rewind(source)
+    usecols = [column for column in header if column in USED_COLUMNS]
+    try:
+        return pd.read_csv(source, engine=engine, usecols=usecols)
+    except (ImportError, pd.errors.ParserError):
+        # pyarrow dosyayı bloklara bölerek okur ve tırnak içindeki satır sonlarını (ör. çok satırlı
+        # Body (HTML)) blok sınırında ayrıştıramaz; C ayrıştırıcısı bu dosyaları sorunsuz okur
+        _rewind(source)
+        return pd.read_csv(source, engine="c", usecols=usecols)
+
+
+def _read_xlsx(source: Any) -> pd.DataFrame:
+    """Read an XLSX export with python-calamine when installed, otherwise openpyxl."""
+
+    try:
+        return pd.read_excel(source, engine="calamine", usecols=USED_COLUMNS.__contains__)
+    except ImportError:
+        _rewind(source)
+        return _read_xlsx_streaming(source)
+
+
+def _openpyxl_cell_value(cell: Any) -> Any:
+    # pandas'ın openpyxl okuyucusuyla aynı dönüşüm: boş hücre "", hata NaN, tam sayı float'lar int
+    if cell.value is None:
+        return ""
+    if cell.data_type == "e":
+        return np.nan
+    if cell.data_type == "n":
+        integer_value = int(cell.value)
+        return integer_value if integer_value == cell.value else float(cell.value)
+    return cell.value
+
+
+def _read_xlsx_streaming(source: Any) -> pd.DataFrame:
+    """Stream the first sheet with openpyxl in read-only mode, keeping only the converter's columns.
+
+    `pd.read_excel` tüm sayfayı (kullanılmayan sütunlar dahil) listeye alıp sonra süzer;
+    burada satırlar okunurken süzülür. Tip çıkarımı pandas ile aynı olsun diye
+    sonuç pandas'ın kendi `TextParser`'ından geçirilir.
+    """
+
+    from openpyxl import load_workbook
+    from pandas.io.parsers import TextParser
+
+    workbook = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook.worksheets[0]
+        sheet.reset_dimensions()
+        rows = sheet.iter_rows()
+        header = [_openpyxl_cell_value(cell) for cell in next(rows, ())]
+        keep = [position for position, name in enumerate(header) if name in USED_COLUMNS]
+        data = [[header[position] for position in keep]]
+        last_row_with_data = 0
+        # Satır/hücre başına çağrılanlar yerel isimlere bağlanır (global/öznitelik araması yapılmaz)
+        convert_cell = _openpyxl_cell_value
+        append_row = data.append
+        for row_number, row in enumerate(rows, start=1):
+            width = len(row)
+            values = [convert_cell(row[position]) if position < width else "" for position in keep]
+            append_row(values)
+            if values.count("") != len(values):
+                last_row_with_data = row_number
+    finally:
+        workbook.close()
+
+    # Sondaki boş satırları at (pandas da aynısını yapar)
+    del data[last_row_with_data + 1 :]
+    return TextParser(data, header=0, skip_blank_lines=False).read()
+
+
+def shopify_to_ikas_converter(
+    source: Union[str, os.PathLike, IO[bytes], pd.DataFrame],
+    store_name: str = "belix",
+    *,
+    suffix: Optional[str] = None,
+    csv_engine: str = "c",
+    dtype_backend: Optional[str] = None,
+) -> pd.DataFrame:
     """Read a Shopify export file and convert it into the ikas schema.
 
     Bu fonksiyon aşağıdaki özel kurallara uyar:
@@ -135,11 +545,26 @@ def shopify_to_ikas_converter(file_path: str, store_name: str = "belix") -> pd.D
 
     Parameters
     ----------
-    file_path : str
-        Absolute or relative path to a Shopify export file in CSV or XLSX format.
+    source : str, os.PathLike, binary file-like object or pd.DataFrame
+        Path to a Shopify export file in CSV or XLSX format, an already opened
+        binary stream (e.g. ``io.BytesIO``) holding the file contents, or an
+        already loaded export as a DataFrame (copied, never modified).
     store_name : str, optional
         Mağaza/satış kanalı adı; `Satış Kanalı:<store_name>` ve
         `Sepet Başına Minimum Alma Adeti:<store_name>` sütunları bu isimle oluşturulur.
+    suffix : str, optional
+        File extension (``".csv"``, ``".xlsx"``, ``".xls"``) of a file-like `source`.
+        Required for streams since they carry no file name; ignored for paths.
+    csv_engine : str, optional
+        `pd.read_csv` parser engine. Defaults to the C parser, which keeps values such
+        as ``Created At`` exactly as written. ``"pyarrow"`` is multithreaded but infers
+        types itself (time-zoned dates become UTC timestamps); it falls back to the C
+        parser when pyarrow is not installed or cannot parse the file (e.g. quoted
+        multi-line values spanning its blocks).
+    dtype_backend : {None, "pyarrow"}, optional
+        ``"pyarrow"`` ise yalnızca metin içeren çıktı sütunları Arrow destekli
+        ``string[pyarrow]`` olarak döner (CSV/Parquet yazımında ek kopya oluşmaz);
+        sayısal ve karışık tipli sütunlar olduğu gibi kalır. pyarrow gerektirir.
 
     Returns
     -------
@@ -147,628 +572,381 @@ def shopify_to_ikas_converter(file_path: str, store_name: str = "belix") -> pd.D
         DataFrame whose columns follow the ikas import schema.
     """
 
-    path = pathlib.Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Input file not found: {file_path}")
+    if dtype_backend not in (None, "pyarrow"):
+        raise ValueError(f"Unsupported dtype_backend: {dtype_backend!r}. Use None or 'pyarrow'.")
 
-    # Dosyayı oku
-    if path.suffix.lower() == ".csv":
-        source_df = pd.read_csv(path)
-    elif path.suffix.lower() in {".xlsx", ".xls"}:
-        source_df = pd.read_excel(path)
+    source_df = _read_source(source, suffix, csv_engine)
+    return _convert_frame(source_df, store_name, dtype_backend)
+
+
+def shopify_to_ikas_stream(
+    source: Union[str, os.PathLike, IO[bytes], pd.DataFrame],
+    out_path: Union[str, os.PathLike],
+    store_name: str = "belix",
+    *,
+    suffix: Optional[str] = None,
+    csv_engine: str = "c",
+    handles_per_chunk: int = HANDLES_PER_CHUNK,
+) -> int:
+    """Convert a Shopify export and write the ikas CSV to `out_path` in handle batches.
+
+    Çok büyük dosyalar için: dönüşüm `handles_per_chunk` Handle'lık gruplar halinde yapılır ve
+    her grubun çıktısı dosyaya eklenir; bellekte girdinin yanında sadece bir grubun çıktısı tutulur.
+    Her Handle'ın tüm satırları aynı grupta olduğu için satırlar `shopify_to_ikas_converter` ile
+    aynıdır; sadece XLSX'ten gelen tarihler her grupta aynı biçimde (ör. "2024-01-02 00:00:00") yazılır.
+    CSV, uygulamadaki indirme gibi BOM'lu UTF-8 olarak yazılır.
+
+    Returns
+    -------
+    int
+        Number of product rows written (header excluded).
+    """
+
+    if handles_per_chunk < 1:
+        raise ValueError("handles_per_chunk must be a positive integer.")
+
+    source_df = _read_source(source, suffix, csv_engine)
+    # Boş Handle'lar gruplara ayırmadan önce doldurulmalı (aksi halde satırlar önceki ürününden kopar)
+    source_df["Handle"] = source_df["Handle"].ffill()
+    # Handle'lar ilk görünme sırasıyla numaralanır; grup numarası = sıra // handles_per_chunk
+    handle_codes, _ = pd.factorize(source_df["Handle"])
+    has_handle = handle_codes >= 0
+    chunk_ids = handle_codes[has_handle] // handles_per_chunk
+
+    rows_written = 0
+    with open(out_path, "w", encoding="utf-8-sig", newline="") as out_file:
+        if not len(chunk_ids):
+            _convert_frame(source_df, store_name).to_csv(out_file, index=False, lineterminator="\n")
+            return 0
+        for chunk_number, (_, chunk_df) in enumerate(source_df[has_handle].groupby(chunk_ids, sort=True)):
+            chunk_output = _convert_frame(chunk_df, store_name)
+            # Tarih sütununun tipi gruptaki değerlere göre datetime64 veya object olabilir;
+            # her grupta tarihler aynı biçimde yazılsın diye Timestamp nesnelerine çevrilir
+            date_columns = chunk_output.select_dtypes(include=["datetime", "datetimetz"]).columns
+            chunk_output = chunk_output.astype(dict.fromkeys(date_columns, object))
+            chunk_output.to_csv(out_file, index=False, header=chunk_number == 0, lineterminator="\n")
+            rows_written += len(chunk_output)
+    return rows_written
+
+
+def _read_source(source: Any, suffix: Optional[str], csv_engine: str) -> pd.DataFrame:
+    """Return the converter's columns from a DataFrame, path or stream and check for Handle."""
+
+    if isinstance(source, pd.DataFrame):
+        # Bellekteki tablo dosyaya yazılıp tekrar okunmaz; dönüşüm Handle sütununu değiştirdiği için kopyalanır
+        source_df = source[[column for column in source.columns if column in USED_COLUMNS]].copy()
     else:
-        raise ValueError("Unsupported file extension. Please provide CSV or XLSX.")
+        source_df = _read_file(source, suffix, csv_engine)
 
     # Handle sütunu zorunlu
     if "Handle" not in source_df.columns:
         raise ValueError("Handle sütunu bulunamadı. Lütfen geçerli bir Shopify export dosyası yükleyin.")
+    return source_df
+
+
+def _read_file(source: Any, suffix: Optional[str], csv_engine: str) -> pd.DataFrame:
+    """Read an export file from a path or stream, dispatching on the file extension."""
+
+    if isinstance(source, (str, os.PathLike)):
+        path = pathlib.Path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"Input file not found: {source}")
+        file_suffix = path.suffix.lower()
+    else:
+        # Bellekteki dosya (ör. io.BytesIO): uzantı ayrıca verilmeli
+        if not suffix:
+            raise ValueError("suffix is required when source is a file-like object.")
+        path = source
+        file_suffix = suffix.lower()
+
+    # Dosyayı oku
+    if file_suffix == ".csv":
+        return _read_csv(path, csv_engine)
+    if file_suffix == ".xlsx":
+        return _read_xlsx(path)
+    if file_suffix == ".xls":
+        return pd.read_excel(path, usecols=USED_COLUMNS.__contains__)
+    raise ValueError("Unsupported file extension. Please provide CSV or XLSX.")
+
+
+def _convert_frame(source_df: pd.DataFrame, store_name: str, dtype_backend: Optional[str] = None) -> pd.DataFrame:
+    """Apply the conversion rules of `shopify_to_ikas_converter` to an already read export."""
+
+    # Dosyadaki sütunlar bir kez kümeye alınır; sonraki varlık kontrolleri bu küme üzerinden yapılır
+    source_columns = frozenset(source_df.columns)
 
     # Boş Handle değerlerini doldur (önceden gelen değeri kullan)
     source_df["Handle"] = source_df["Handle"].ffill()
+    # Handle kategorik tutulur: groupby'lar string hash'lemek yerine tamsayı kodlarla çalışır.
+    # Kategoriler ilk görünme sırasındadır, böylece grupların sırası dosyadaki sırayla aynı kalır
+    source_df["Handle"] = pd.Categorical(source_df["Handle"], categories=source_df["Handle"].dropna().unique())
+
+    # Metin normalizasyonu: Option Value ve SKU değerleri tek seferde (vektörel) temizlenir,
+    # büyük harfli halleri hem "Default Title" kontrolünde hem birleştirme anahtarında kullanılır
+    option1_text = _stripped_text(source_df, "Option1 Value")
+    option2_text = _stripped_text(source_df, "Option2 Value")
+    option1_upper = option1_text.str.upper()
+    option2_upper = option2_text.str.upper()
+    # "Default Title" değerlerini boş olarak kabul et (case-insensitive)
+    option1_is_default = option1_upper == "DEFAULT TITLE"
+    option2_is_default = option2_upper == "DEFAULT TITLE"
+    option1_values = option1_text.mask(option1_is_default, "")
+    option2_values = option2_text.mask(option2_is_default, "")
+    option1_upper = option1_upper.mask(option1_is_default, "")
+    option2_upper = option2_upper.mask(option2_is_default, "")
+    sku_values = _stripped_text(source_df, "Variant SKU")
+    # Her Handle'ın ilk satırı: basit ürün kontrolü ve Varyant Tip'leri buradan belirlenir
+    first_row_mask = source_df["Handle"].notna() & ~source_df["Handle"].duplicated()
 
     # Handle'a göre grupla ve ortak bilgileri topla
-    # Önce her Handle için ortak bilgileri belirle
-    handle_groups = source_df.groupby("Handle", sort=False)
-
     # Ortak bilgileri topla (her Handle için ilk boş olmayan değeri al)
-    common_info = {}
-    image_urls = {}
-    handle_status = {}  # Her Handle için Status bilgisini sakla
-
-    for handle, group_df in handle_groups:
-        # Ortak bilgiler (ilk boş olmayan değeri kullan)
-        # Kategori için önce Product Category'yi dene, yoksa Type'ı kullan
-        category_col = None
-        if "Product Category" in group_df.columns and not group_df["Product Category"].dropna().empty:
-            category_col = "Product Category"
-        elif "Type" in group_df.columns and not group_df["Type"].dropna().empty:
-            category_col = "Type"
-        
-        # Metadata bilgilerini topla
-        seo_title = ""
-        seo_description = ""
-        if "SEO Title" in group_df.columns and not group_df["SEO Title"].dropna().empty:
-            seo_title = str(group_df["SEO Title"].dropna().iloc[0])
-        if "SEO Description" in group_df.columns and not group_df["SEO Description"].dropna().empty:
-            seo_description = str(group_df["SEO Description"].dropna().iloc[0])
-        seo_description = seo_description[:320]
-        
-        # Google Ürün Kategorisi
-        google_category = ""
-        if "Google Shopping / Google Product Category" in group_df.columns and not group_df["Google Shopping / Google Product Category"].dropna().empty:
-            google_category = normalize_google_category_value(group_df["Google Shopping / Google Product Category"].dropna().iloc[0])
-        elif "Google Product Category" in group_df.columns and not group_df["Google Product Category"].dropna().empty:
-            google_category = normalize_google_category_value(group_df["Google Product Category"].dropna().iloc[0])
-        
-        # Tip (Type)
-        tip_value = ""
-        if "Type" in group_df.columns and not group_df["Type"].dropna().empty:
-            tip_value = group_df["Type"].dropna().iloc[0]
-        
-        # Oluşturulma Tarihi
-        created_at = ""
-        if "Created At" in group_df.columns and not group_df["Created At"].dropna().empty:
-            created_at = group_df["Created At"].dropna().iloc[0]
-        
-        # Status/Published bilgisini topla (Handle seviyesinde)
-        status_value = None
-        # Önce Status sütununu kontrol et
-        if "Status" in group_df.columns and not group_df["Status"].dropna().empty:
-            status_value = str(group_df["Status"].dropna().iloc[0]).strip().upper()
-        elif "Published" in group_df.columns and not group_df["Published"].dropna().empty:
-            published = str(group_df["Published"].dropna().iloc[0]).strip().upper()
-            # Published TRUE ise Active olarak kabul et
-            if published in ["TRUE", "1", "YES"]:
-                status_value = "ACTIVE"
-        
-        handle_status[handle] = status_value == "ACTIVE" if status_value else False
-        
-        common_info[handle] = {
-            "Title": group_df["Title"].dropna().iloc[0] if "Title" in group_df.columns and not group_df["Title"].dropna().empty else "",
-            "Body (HTML)": group_df["Body (HTML)"].dropna().iloc[0] if "Body (HTML)" in group_df.columns and not group_df["Body (HTML)"].dropna().empty else "",
-            "Category": group_df[category_col].dropna().iloc[0] if category_col else "",
-            "Tags": group_df["Tags"].dropna().iloc[0] if "Tags" in group_df.columns and not group_df["Tags"].dropna().empty else "",
-            "Vendor": group_df["Vendor"].dropna().iloc[0] if "Vendor" in group_df.columns and not group_df["Vendor"].dropna().empty else "",
-            "SEO Title": seo_title,
-            "SEO Description": seo_description,
-            "Google Category": google_category,
-            "Type": tip_value,
-            "Created At": created_at,
-        }
-
-        # Görsel URL'lerini topla (Image Src + Variant Image)
-        image_urls_set: Set[str] = set()
+    # Tek bir groupby.first() tüm sütunlar için ilk boş olmayan değeri C seviyesinde bulur;
+    # kaynakta olmayan sütunlar reindex ile tamamen boş (NaN) gelir
+    common_columns = [column for column in COMMON_INFO_COLUMNS if column in source_columns]
+    first_values = (
+        source_df[["Handle"] + common_columns]
+        .groupby("Handle", sort=False, observed=True)
+        .first()
+        .reindex(columns=COMMON_INFO_COLUMNS)
+    )
 
-        if "Image Src" in group_df.columns:
-            image_srcs = group_df["Image Src"].dropna().astype(str)
-            image_urls_set.update(image_srcs[image_srcs != ""])
+    common_df = pd.DataFrame(
+        {
+            "Title": _fill_empty(first_values["Title"]),
+            "Body (HTML)": _fill_empty(first_values["Body (HTML)"]),
+            # Kategori için önce Product Category'yi dene, yoksa Type'ı kullan
+            "Category": _fill_empty(_coalesce(first_values["Product Category"], first_values["Type"])),
+            "Tags": _fill_empty(first_values["Tags"]),
+            "Vendor": _fill_empty(first_values["Vendor"]),
+            # Metadata bilgileri
+            "SEO Title": _as_text(first_values["SEO Title"]),
+            "SEO Description": _as_text(first_values["SEO Description"]).str[:320],
+            # Google Ürün Kategorisi
+            "Google Category": _coalesce(
+                first_values["Google Shopping / Google Product Category"], first_values["Google Product Category"]
+            ).map(normalize_google_category_value),
+            "Type": _fill_empty(first_values["Type"]),
+            "Created At": _fill_empty(first_values["Created At"]),
+        },
+        index=first_values.index,
+    )
 
-        if "Variant Image" in group_df.columns:
-            variant_images = group_df["Variant Image"].dropna().astype(str)
-            image_urls_set.update(variant_images[variant_images != ""])
+    # Görsel URL'lerini topla (Image Src + Variant Image)
+    # İki sütun tek uzun sütunda birleştirilir, her Handle için tekil URL'ler sıralanıp birleştirilir
+    image_columns = [column for column in ("Image Src", "Variant Image") if column in source_columns]
+    image_values = pd.concat(
+        [source_df[["Handle", column]].rename(columns={column: "URL"}) for column in image_columns]
+        or [pd.DataFrame(columns=["Handle", "URL"])]
+    ).dropna()
+    image_values["URL"] = image_values["URL"].astype(str)
+    image_values = image_values[image_values["URL"] != ""]
+    # Noktalı virgülle birleştir (boşluksuz)
+    image_urls = (
+        image_values.groupby("Handle", sort=False, observed=True)["URL"]
+        .agg(lambda urls: ";".join(sorted(urls.unique())))
+        .reindex(first_values.index, fill_value="")
+    )
 
-        # Noktalı virgülle birleştir (boşluksuz)
-        image_urls[handle] = ";".join(sorted(image_urls_set)) if image_urls_set else ""
+    # Basit ürün satırları için ilk SKU/barkod ve ilk sıfırdan farklı fiyat/stok değerleri
+    value_candidates = _variant_value_candidates(source_df)
+    handle_firsts = _first_variant_values(value_candidates, [source_df["Handle"]])
+
+    # VARYANT KOMBİNASYONLARI: Aynı varyant değerlerine sahip satırlar tek satırda birleştirilir
+    # (Shopify'da aynı varyant için her görsel ayrı satır olabilir)
+    # Geçerli varyant: En az bir Option Value veya Variant SKU olmalı
+    valid_variant_rows = (option1_values != "") | (option2_values != "") | (sku_values != "")
+    # Birleştirme anahtarı: Variant SKU varsa ("SKU", sku), yoksa büyük harfli Option Value'lar
+    has_sku = sku_values != ""
+    combination_keys = [
+        source_df["Handle"],
+        pd.Series(np.where(has_sku, "SKU", option1_upper), index=source_df.index, name="_k1"),
+        pd.Series(np.where(has_sku, sku_values, option2_upper), index=source_df.index, name="_k2"),
+    ]
+    valid_keys = [key[valid_variant_rows] for key in combination_keys]
+    # Option Value'lar kombinasyondaki ilk boş olmayan değerden, SKU ilk satırın anahtarından alınır
+    combination_options = pd.DataFrame(
+        {
+            "Option1 Value": option1_values.where(option1_values != ""),
+            "Option2 Value": option2_values.where(option2_values != ""),
+            "Variant SKU": sku_values,
+        }
+    )[valid_variant_rows].groupby(valid_keys, sort=False, observed=True).first()
+    # SKU'su sadece boşluktan oluşan satırlar barkod/fiyat/stok için atlanır (önceki döngüdeki davranış)
+    blank_sku_rows = _column_or_empty(source_df, "Variant SKU").notna() & ~has_sku
+    combination_values = _first_variant_values(
+        value_candidates[valid_variant_rows], valid_keys, skip_rows=blank_sku_rows[valid_variant_rows]
+    )
+    combinations = combination_options.fillna("").join(combination_values.drop(columns="SKU"))
 
     # Yeni DataFrame oluştur
     store_name_value = store_name.strip() if store_name and store_name.strip() else "belix"
-    ikas_rows = []
-
-    sales_channel_column = f"Satış Kanalı:{store_name_value}"
-    min_order_column = f"Sepet Başına Minimum Alma Adeti:{store_name_value}"
-
-    for handle, group_df in handle_groups:
-        # Grup ID (Handle'ı kullan, benzersiz olması için)
-        grup_id = handle
-
-        # Ortak bilgiler
-        common = common_info[handle]
-        images = image_urls[handle]
-
-        # Basit ürün kontrolü: Eğer Option Value "Default Title" ise basit üründür
-        is_simple_product = False
-        # İlk satırı kontrol et (tüm satırlar aynı Handle'a sahip olduğu için ilk satır yeterli)
-        first_row = group_df.iloc[0]
-        if "Option1 Value" in first_row and pd.notna(first_row["Option1 Value"]):
-            if str(first_row["Option1 Value"]).strip().upper() == "DEFAULT TITLE":
-                is_simple_product = True
-        
-        # Basit ürün ise Grup ID'yi boş bırak
-        if is_simple_product:
-            grup_id = ""
-            
-            # BASİT ÜRÜN: Tüm satırları birleştirip TEK SATIR oluştur
-            # Tüm satırlardaki bilgileri birleştir
-            variant_sku = ""
-            barcode = ""
-            sale_price = 0.0
-            discounted_price = 0.0
-            stock_qty = 0
-            
-            # İlk boş olmayan değerleri al
-            for idx, row in group_df.iterrows():
-                if not variant_sku and "Variant SKU" in row and pd.notna(row["Variant SKU"]):
-                    variant_sku = str(row["Variant SKU"])
-                
-                if not barcode:
-                    if "Variant Barcode" in row and pd.notna(row["Variant Barcode"]):
-                        barcode = str(row["Variant Barcode"])
-                    elif "Barcode" in row and pd.notna(row["Barcode"]):
-                        barcode = str(row["Barcode"])
-                
-                if sale_price == 0.0:
-                    if "Variant Price" in row and pd.notna(row["Variant Price"]):
-                        try:
-                            sale_price = float(row["Variant Price"])
-                        except (ValueError, TypeError):
-                            pass
-                
-                if discounted_price == 0.0:
-                    compare_price = row.get("Compare At Price", None)
-                    if compare_price is None or pd.isna(compare_price):
-                        compare_price = row.get("Variant Compare At Price", None)
-                    if compare_price is not None and pd.notna(compare_price):
-                        try:
-                            discounted_price = float(compare_price)
-                        except (ValueError, TypeError):
-                            pass
-                
-                if stock_qty == 0:
-                    if "Variant Inventory Qty" in row and pd.notna(row["Variant Inventory Qty"]):
-                        try:
-                            stock_qty = int(row["Variant Inventory Qty"])
-                        except (ValueError, TypeError):
-                            pass
-            
-            # Satış Kanalı: Handle seviyesinde Status kontrolü
-            satis_kanali = "VISIBLE"
-            sale_price, discounted_price = order_prices(sale_price, discounted_price)
-
-            # Basit ürün için TEK SATIR oluştur
-            ikas_row = {
-                "Ürün Grup ID": "",  # Basit ürün için boş
-                "Varyant ID": "",  # Boş bırak
-                "İsim": common["Title"],
-                "Açıklama": common["Body (HTML)"],
-                "Satış Fiyatı": sale_price,
-                "İndirimli Fiyatı": discounted_price,
-                "Alış Fiyatı": "",  # Boş
-                "Barkod Listesi": barcode,
-                "SKU": variant_sku,
-                "Silindi mi?": "",  # Boş
-                "Marka": common["Vendor"],
-                "Kategoriler": common["Category"],
-                "Etiketler": common["Tags"],
-                "Resim URL": images,
-                "Metadata Başlık": common["SEO Title"],
-                "Metadata Açıklama": common["SEO Description"],
-                "Slug": handle,
-                "Stok:Ana Depo": stock_qty,
-                "Tip": common["Type"],
-                "Varyant Tip 1": "",  # Basit ürün için boş
-                "Varyant Değer 1": "",  # Basit ürün için boş
-                "Varyant Tip 2": "",  # Basit ürün için boş
-                "Varyant Değer 2": "",  # Basit ürün için boş
-                "Desi": "",  # Boş
-                "HS Kod": "",  # Boş
-                "Birim Ürün Miktarı": "",  # Boş
-                "Ürün Birimi": "",  # Boş
-                "Satılan Ürün Miktarı": "",  # Boş
-                "Satılan Ürün Birimi": "",  # Boş
-                "Google Ürün Kategorisi": common["Google Category"],
-                "Tedarikçi": common["Vendor"],
-                "Stoğu Tükenince Satmaya Devam Et": "",  # Boş
-                sales_channel_column: satis_kanali,  # Her satıra VISIBLE
-                min_order_column: "",  # Boş
-                "Sepet Başına Maksimum Alma Adeti:belix": "",  # Boş
-                "Varyant Aktiflik": "",  # Boş bırak
-                "Oluşturulma Tarihi": common["Created At"],
-            }
-            
-            ikas_rows.append(ikas_row)
-            continue  # Basit ürün için döngüyü atla, zaten tek satır oluşturduk
-
-        # VARYANTLI ÜRÜN: Aynı varyant kombinasyonuna sahip satırları birleştir
-        # Sorun: Shopify'da aynı varyant için birden fazla görsel varsa, her görsel için ayrı satır olabilir
-        # Çözüm: Aynı varyant değerlerine (Option1 Value + Option2 Value) sahip satırları tek satırda birleştir
-        
-        # Satış Kanalı: Handle seviyesinde Status kontrolü
-        satis_kanali = "VISIBLE"
-        
-        # Varyant Tip'leri tüm satırlarda tekrarlamak için, önce tüm varyant tiplerini topla
-        variant_type_1 = ""
-        variant_type_2 = ""
-        # İlk satırda Varyant Tip'leri belirle
-        if len(group_df) > 0:
-            first_row = group_df.iloc[0]
-            if "Option1 Name" in first_row and pd.notna(first_row["Option1 Name"]):
-                variant_type_1 = str(first_row["Option1 Name"])
-            if "Option2 Name" in first_row and pd.notna(first_row["Option2 Name"]):
-                variant_type_2 = str(first_row["Option2 Name"])
-
-        # Varyant kombinasyonlarına göre grupla (Option1 Value + Option2 Value + Variant SKU)
-        # Aynı varyant değerlerine sahip satırları tek satırda birleştir
-        # ÖNEMLİ: Boş varyant değerlerine sahip satırları filtrele (basit ürün değilse)
-        variant_combinations = {}
-        
-        for idx, row in group_df.iterrows():
-            # Varyant değerlerini al (kombinasyon anahtarı olarak kullan)
-            option1_value = ""
-            option2_value = ""
-            variant_sku = ""
-            
-            # Varyant değerlerini al ve temizle
-            # NaN, None, boş string kontrolü
-            option1_value = ""
-            if "Option1 Value" in row:
-                val = row["Option1 Value"]
-                if pd.notna(val) and val != "" and str(val).strip() != "":
-                    option1_value = str(val).strip()
-            
-            option2_value = ""
-            if "Option2 Value" in row:
-                val = row["Option2 Value"]
-                if pd.notna(val) and val != "" and str(val).strip() != "":
-                    option2_value = str(val).strip()
-            
-            variant_sku = ""
-            if "Variant SKU" in row:
-                val = row["Variant SKU"]
-                if pd.notna(val) and val != "" and str(val).strip() != "":
-                    variant_sku = str(val).strip()
-            
-            # "Default Title" değerlerini boş olarak kabul et (case-insensitive)
-            if option1_value and str(option1_value).upper().strip() == "DEFAULT TITLE":
-                option1_value = ""
-            if option2_value and str(option2_value).upper().strip() == "DEFAULT TITLE":
-                option2_value = ""
-            
-            # Son kontrol: Boş string'leri temizle
-            if not option1_value or option1_value == "":
-                option1_value = ""
-            if not option2_value or option2_value == "":
-                option2_value = ""
-            if not variant_sku or variant_sku == "":
-                variant_sku = ""
-            
-            # ÖNEMLİ: Geçerli varyant kontrolü ve birleştirme anahtarı
-            # Varyant kombinasyon anahtarı oluştur
-            # Strateji: Hem Option Value'ları hem Variant SKU'yu birlikte kullan
-            # Eğer Option Value'lar varsa, onları kullan (daha güvenilir)
-            # Eğer Option Value'lar yoksa ama Variant SKU varsa, onu kullan
-            
-            # Geçerli varyant kontrolü: En az bir Option Value veya Variant SKU olmalı
-            if not option1_value and not option2_value and not variant_sku:
-                # Hiç geçerli varyant bilgisi yoksa, bu satırı atla
-                continue
-            
-            # Birleştirme anahtarı: ÖNCE Variant SKU'ya göre kontrol et, sonra Option Value'lara göre
-            # ÖNEMLİ: Aynı Variant SKU'ya sahip satırlar aynı varyant olmalı (görsel için tekrarlanan satırlar)
-            # Strateji: Variant SKU varsa, onu birleştirme anahtarı olarak kullan
-            # Eğer Variant SKU yoksa, Option Value'lara göre grupla
-            
-            normalized_option1 = option1_value.strip().upper() if option1_value else ""
-            normalized_option2 = option2_value.strip().upper() if option2_value else ""
-            normalized_sku = variant_sku.strip() if variant_sku else ""
-            
-            # ÖNEMLİ: Variant SKU varsa, onu birleştirme anahtarı olarak kullan (daha güvenilir)
-            # Aynı SKU'ya sahip satırlar aynı varyant olmalı (Option Value'lar farklı olsa bile)
-            if normalized_sku:
-                # Variant SKU varsa, onu kullan (Option Value'ları da sakla ama SKU öncelikli)
-                variant_key = ("SKU", normalized_sku)
-            elif normalized_option1 or normalized_option2:
-                # Variant SKU yoksa, Option Value'lara göre grupla
-                variant_key = (normalized_option1, normalized_option2)
-            else:
-                # Bu duruma düşmemeli (yukarıdaki kontrol ile atlanmalı)
-                continue
-            
-            # Bu kombinasyon için ilk kez karşılaşıyorsak, yeni bir kayıt oluştur
-            if variant_key not in variant_combinations:
-                # Orijinal değerleri sakla
-                # Eğer SKU bazlı gruplama yapıyorsak, Option Value'ları ilk boş olmayan değerden al
-                variant_combinations[variant_key] = {
-                    "Option1 Value": option1_value if option1_value else "",  # Orijinal değer
-                    "Option2 Value": option2_value if option2_value else "",  # Orijinal değer
-                    "Variant SKU": normalized_sku,  # SKU'yu da sakla
-                    "rows": []  # Bu varyant için tüm satırları sakla
-                }
-            else:
-                # Bu kombinasyon zaten var, Option Value'ları güncelle (eğer boşsa ve yeni satırda varsa)
-                if not variant_combinations[variant_key]["Option1 Value"] and option1_value:
-                    variant_combinations[variant_key]["Option1 Value"] = option1_value
-                if not variant_combinations[variant_key]["Option2 Value"] and option2_value:
-                    variant_combinations[variant_key]["Option2 Value"] = option2_value
-            
-            # Bu satırı bu varyant kombinasyonuna ekle
-            variant_combinations[variant_key]["rows"].append(row)
-        
-        # Her varyant kombinasyonu için tek bir ikas satırı oluştur
-        # ÖNEMLİ: Eğer hiç geçerli varyant kombinasyonu yoksa, basit ürün olarak işle
-        if not variant_combinations:
-            # Hiç geçerli varyant yoksa, basit ürün olarak işle
-            is_simple_product = True
-            grup_id = ""
-            
-            # Basit ürün için tüm satırları birleştir (daha önceki basit ürün mantığı)
-            variant_sku = ""
-            barcode = ""
-            sale_price = 0.0
-            discounted_price = 0.0
-            stock_qty = 0
-            
-            for idx, row in group_df.iterrows():
-                if not variant_sku and "Variant SKU" in row and pd.notna(row["Variant SKU"]):
-                    variant_sku = str(row["Variant SKU"])
-                if not barcode:
-                    if "Variant Barcode" in row and pd.notna(row["Variant Barcode"]):
-                        barcode = str(row["Variant Barcode"])
-                    elif "Barcode" in row and pd.notna(row["Barcode"]):
-                        barcode = str(row["Barcode"])
-                if sale_price == 0.0:
-                    if "Variant Price" in row and pd.notna(row["Variant Price"]):
-                        try:
-                            sale_price = float(row["Variant Price"])
-                        except (ValueError, TypeError):
-                            pass
-                if discounted_price == 0.0:
-                    compare_price = row.get("Compare At Price", None)
-                    if compare_price is None or pd.isna(compare_price):
-                        compare_price = row.get("Variant Compare At Price", None)
-                    if compare_price is not None and pd.notna(compare_price):
-                        try:
-                            discounted_price = float(compare_price)
-                        except (ValueError, TypeError):
-                            pass
-                if stock_qty == 0:
-                    if "Variant Inventory Qty" in row and pd.notna(row["Variant Inventory Qty"]):
-                        try:
-                            stock_qty = int(row["Variant Inventory Qty"])
-                        except (ValueError, TypeError):
-                            pass
-            
-            satis_kanali = "VISIBLE"
-            
-            sale_price, discounted_price = order_prices(sale_price, discounted_price)
-
-            ikas_row = {
-                "Ürün Grup ID": "",
-                "Varyant ID": "",
-                "İsim": common["Title"],
-                "Açıklama": common["Body (HTML)"],
-                "Satış Fiyatı": sale_price,
-                "İndirimli Fiyatı": discounted_price,
-                "Alış Fiyatı": "",
-                "Barkod Listesi": barcode,
-                "SKU": variant_sku,
-                "Silindi mi?": "",
-                "Marka": common["Vendor"],
-                "Kategoriler": common["Category"],
-                "Etiketler": common["Tags"],
-                "Resim URL": images,
-                "Metadata Başlık": common["SEO Title"],
-                "Metadata Açıklama": common["SEO Description"],
-                "Slug": handle,
-                "Stok:Ana Depo": stock_qty,
-                "Tip": common["Type"],
-                "Varyant Tip 1": "",
-                "Varyant Değer 1": "",
-                "Varyant Tip 2": "",
-                "Varyant Değer 2": "",
-                "Desi": "",
-                "HS Kod": "",
-                "Birim Ürün Miktarı": "",
-                "Ürün Birimi": "",
-                "Satılan Ürün Miktarı": "",
-                "Satılan Ürün Birimi": "",
-                "Google Ürün Kategorisi": common["Google Category"],
-                "Tedarikçi": common["Vendor"],
-                "Stoğu Tükenince Satmaya Devam Et": "",
-                sales_channel_column: satis_kanali,
-                min_order_column: "",
-                "Sepet Başına Maksimum Alma Adeti:belix": "",
-                "Varyant Aktiflik": "",
-                "Oluşturulma Tarihi": common["Created At"],
-            }
-            
-            ikas_rows.append(ikas_row)
-            continue  # Basit ürün için döngüyü atla
-        
-        # Varyantlı ürünler için her kombinasyonu işle
-        for variant_key, variant_data in variant_combinations.items():
-            variant_rows = variant_data["rows"]
-            option1_value = variant_data["Option1 Value"]
-            option2_value = variant_data["Option2 Value"]
-            variant_sku_from_key = variant_data.get("Variant SKU", "")
-            
-            # İlk boş olmayan değerleri al (tüm satırlardan)
-            variant_sku = variant_sku_from_key if variant_sku_from_key else ""
-            barcode = ""
-            sale_price = 0.0
-            discounted_price = 0.0
-            stock_qty = 0
-            
-            # Option Value'ları tüm satırlardan topla (eğer variant_data'da boşsa)
-            if not option1_value:
-                for row in variant_rows:
-                    if "Option1 Value" in row and pd.notna(row["Option1 Value"]):
-                        val = str(row["Option1 Value"]).strip()
-                        if val and val.upper() != "DEFAULT TITLE":
-                            option1_value = val
-                            break
-            
-            if not option2_value:
-                for row in variant_rows:
-                    if "Option2 Value" in row and pd.notna(row["Option2 Value"]):
-                        val = str(row["Option2 Value"]).strip()
-                        if val and val.upper() != "DEFAULT TITLE":
-                            option2_value = val
-                            break
-            
-            for row in variant_rows:
-                # Varyant SKU - zaten variant_key'den alındı, ama yoksa satırdan al
-                if not variant_sku and "Variant SKU" in row and pd.notna(row["Variant SKU"]):
-                    variant_sku = str(row["Variant SKU"]).strip()
-                    if not variant_sku:  # Boş string ise devam et
-                        continue
-                
-                # Barkod Listesi - ilk boş olmayan değeri al
-                if not barcode:
-                    if "Variant Barcode" in row and pd.notna(row["Variant Barcode"]):
-                        barcode = str(row["Variant Barcode"])
-                    elif "Barcode" in row and pd.notna(row["Barcode"]):
-                        barcode = str(row["Barcode"])
-                
-                # Satış Fiyatı - ilk boş olmayan değeri al
-                if sale_price == 0.0:
-                    if "Variant Price" in row and pd.notna(row["Variant Price"]):
-                        try:
-                            sale_price = float(row["Variant Price"])
-                        except (ValueError, TypeError):
-                            pass
-                
-                # İndirimli Fiyatı - ilk boş olmayan değeri al
-                if discounted_price == 0.0:
-                    compare_price = row.get("Compare At Price", None)
-                    if compare_price is None or pd.isna(compare_price):
-                        compare_price = row.get("Variant Compare At Price", None)
-                    if compare_price is not None and pd.notna(compare_price):
-                        try:
-                            discounted_price = float(compare_price)
-                        except (ValueError, TypeError):
-                            pass
-                
-                # Stok:Ana Depo - ilk boş olmayan değeri al
-                if stock_qty == 0:
-                    if "Variant Inventory Qty" in row and pd.notna(row["Variant Inventory Qty"]):
-                        try:
-                            stock_qty = int(row["Variant Inventory Qty"])
-                        except (ValueError, TypeError):
-                            pass
-            
-            # Varyant Tip ve Değerler - Varyantlı ürünler için
-            # Varyant Tip'ler HER satırda tekrarlanarak dolu gelmeli
-            variant_tip_1 = variant_type_1  # Tüm satırlarda aynı
-            variant_deger_1 = ""
-            variant_tip_2 = variant_type_2  # Tüm satırlarda aynı
-            variant_deger_2 = ""
-            
-            # Varyant Değerleri - variant_data'dan al (zaten orijinal değerler saklanmış)
-            # Orijinal değerleri kullan (normalize edilmiş değerler sadece eşleştirme için)
-            if option1_value and option1_value.upper() != "DEFAULT TITLE":
-                variant_deger_1 = option1_value
-            
-            if option2_value and option2_value.upper() != "DEFAULT TITLE":
-                variant_deger_2 = option2_value
-
-            # Varyant Aktiflik: Boş bırak (yeni kural)
-            variant_aktiflik = ""
-
-            # Tedarikçi (Vendor'dan veya ayrı bir sütundan)
-            tedarikci = common["Vendor"]
-
-            sale_price, discounted_price = order_prices(sale_price, discounted_price)
-
-            # ikas satırı oluştur (tüm 37 sütun)
-            ikas_row = {
-                "Ürün Grup ID": grup_id,
-                "Varyant ID": "",  # Boş bırak
-                "İsim": common["Title"],
-                "Açıklama": common["Body (HTML)"],
-                "Satış Fiyatı": sale_price,
-                "İndirimli Fiyatı": discounted_price,
-                "Alış Fiyatı": "",  # Boş
-                "Barkod Listesi": barcode,
-                "SKU": variant_sku,
-                "Silindi mi?": "",  # Boş
-                "Marka": common["Vendor"],
-                "Kategoriler": common["Category"],
-                "Etiketler": common["Tags"],
-                "Resim URL": images,
-                "Metadata Başlık": common["SEO Title"],
-                "Metadata Açıklama": common["SEO Description"],
-                "Slug": handle,
-                "Stok:Ana Depo": stock_qty,
-                "Tip": common["Type"],
-                "Varyant Tip 1": variant_tip_1,
-                "Varyant Değer 1": variant_deger_1,
-                "Varyant Tip 2": variant_tip_2,
-                "Varyant Değer 2": variant_deger_2,
-                "Desi": "",  # Boş
-                "HS Kod": "",  # Boş
-                "Birim Ürün Miktarı": "",  # Boş
-                "Ürün Birimi": "",  # Boş
-                "Satılan Ürün Miktarı": "",  # Boş
-                "Satılan Ürün Birimi": "",  # Boş
-                "Google Ürün Kategorisi": common["Google Category"],
-                "Tedarikçi": tedarikci,
-                "Stoğu Tükenince Satmaya Devam Et": "",  # Boş
-                sales_channel_column: satis_kanali,  # Handle seviyesinde Status kontrolü - TÜM satırlara yazılır
-                min_order_column: "",  # Boş
-                "Sepet Başına Maksimum Alma Adeti:belix": "",  # Boş
-                "Varyant Aktiflik": variant_aktiflik,  # Boş bırak
-                "Oluşturulma Tarihi": common["Created At"],
-            }
 
-            ikas_rows.append(ikas_row)
+    first_rows = source_df[first_row_mask].set_index("Handle")
+    # Basit ürün kontrolü: Eğer ilk satırın Option Value'su "Default Title" ise basit üründür
+    is_simple_product = pd.Series(option1_is_default[first_row_mask].to_numpy(), index=first_rows.index)
+    # ÖNEMLİ: Hiç geçerli varyant kombinasyonu olmayan ürünler de basit ürün olarak işlenir
+    variant_handles = combinations.index.get_level_values("Handle")
+    is_simple_product |= ~first_rows.index.isin(variant_handles)
+
+    # BASİT ÜRÜN: Tüm satırlar TEK SATIR olarak birleştirilir (Grup ID ve varyant alanları boş)
+    simple_firsts = handle_firsts[is_simple_product.reindex(handle_firsts.index).to_numpy()]
+    simple_rows = pd.DataFrame(
+        {
+            "Ürün Grup ID": "",
+            "Satış Fiyatı": simple_firsts["Price"],
+            "İndirimli Fiyatı": simple_firsts["Compare Price"],
+            "Barkod Listesi": simple_firsts["Barcode"],
+            "SKU": simple_firsts["SKU"],
+            "Slug": simple_firsts.index.astype(object),
+            "Stok:Ana Depo": simple_firsts["Stock"],
+            "Varyant Tip 1": "",
+            "Varyant Değer 1": "",
+            "Varyant Tip 2": "",
+            "Varyant Değer 2": "",
+        },
+        index=simple_firsts.index.astype(object),
+    )
+
+    # VARYANTLI ÜRÜN: Her kombinasyon için bir satır; Grup ID olarak Handle kullanılır
+    variant_combinations = combinations[~is_simple_product.reindex(variant_handles).to_numpy()]
+    combination_handles = variant_combinations.index.get_level_values("Handle").astype(object)
+    # Varyant Tip'ler ilk satırdan alınır ve HER satırda tekrarlanır
+    variant_type_1 = _as_text(_column_or_empty(first_rows, "Option1 Name")).reindex(combination_handles)
+    variant_type_2 = _as_text(_column_or_empty(first_rows, "Option2 Name")).reindex(combination_handles)
+    variant_rows = pd.DataFrame(
+        {
+            "Ürün Grup ID": combination_handles,
+            "Satış Fiyatı": variant_combinations["Price"].to_numpy(),
+            "İndirimli Fiyatı": variant_combinations["Compare Price"].to_numpy(),
+            "Barkod Listesi": variant_combinations["Barcode"].to_numpy(),
+            "SKU": variant_combinations["Variant SKU"].to_numpy(),
+            "Slug": combination_handles,
+            "Stok:Ana Depo": variant_combinations["Stock"].to_numpy(),
+            "Varyant Tip 1": variant_type_1.to_numpy(),
+            # Orijinal değerler kullanılır (normalize edilmiş değerler sadece eşleştirme için)
+            "Varyant Değer 1": variant_combinations["Option1 Value"].to_numpy(),
+            "Varyant Tip 2": variant_type_2.to_numpy(),
+            "Varyant Değer 2": variant_combinations["Option2 Value"].to_numpy(),
+        },
+        index=combination_handles,
+    )
+
+    # Handle'lar dosyadaki ilk görünme sırasıyla, kombinasyonlar Handle içinde kendi sırasıyla gelir
+    handle_order = pd.Series(np.arange(len(first_values)), index=first_values.index)
+    output_rows = pd.concat([simple_rows, variant_rows], ignore_index=True)
+    output_rows = output_rows.iloc[
+        np.argsort(handle_order.reindex(output_rows["Slug"]).to_numpy(), kind="stable")
+    ].reset_index(drop=True)
+    output_rows["Satış Fiyatı"], output_rows["İndirimli Fiyatı"] = order_prices(
+        output_rows["Satış Fiyatı"], output_rows["İndirimli Fiyatı"]
+    )
 
     # DataFrame oluştur
-    ikas_df = pd.DataFrame(ikas_rows, columns=build_ikas_columns(store_name_value))
+    row_handles = output_rows["Slug"].to_numpy()
+    if not len(row_handles):
+        return pd.DataFrame(columns=build_ikas_columns(store_name_value))
+    common_rows = common_df.reindex(row_handles)
+    ikas_df = pd.DataFrame(
+        {
+            **{column: output_rows[column].to_numpy() for column in ROW_VALUE_COLUMNS},
+            "İsim": common_rows["Title"].to_numpy(),
+            "Açıklama": common_rows["Body (HTML)"].to_numpy(),
+            "Marka": common_rows["Vendor"].to_numpy(),
+            "Kategoriler": common_rows["Category"].to_numpy(),
+            "Etiketler": common_rows["Tags"].to_numpy(),
+            "Resim URL": image_urls.reindex(row_handles).to_numpy(),
+            "Metadata Başlık": common_rows["SEO Title"].to_numpy(),
+            "Metadata Açıklama": common_rows["SEO Description"].to_numpy(),
+            "Tip": common_rows["Type"].to_numpy(),
+            "Google Ürün Kategorisi": common_rows["Google Category"].to_numpy(),
+            "Tedarikçi": common_rows["Vendor"].to_numpy(),
+            "Oluşturulma Tarihi": common_rows["Created At"].to_numpy(),
+        },
+        # Diziler zaten bu DataFrame için üretildi; kurucunun her sütunu tekrar kopyalamasına gerek yok
+        copy=False,
+    )
+    # Satır listesinden kurulmuş gibi: tamamı sayı/tarih olan yayılmış sütunlar kendi tipine çevrilir
+    ikas_df = ikas_df.infer_objects()
+    # Her zaman boş kalan sütunlar ve sabit Satış Kanalı tüm satırlara tek seferde eklenir
+    ikas_df = ikas_df.assign(
+        **{column.format(store_name=store_name_value): "" for column in EMPTY_COLUMNS_TEMPLATE},
+        **{f"Satış Kanalı:{store_name_value}": "VISIBLE"},  # Her satıra VISIBLE
+    ).reindex(columns=build_ikas_columns(store_name_value))
 
     # NOT: Basit ürünler zaten tek satırda birleştirilmiş durumda
     # Varyantlı olmayan ürünler için ek kontrol yapılmasına gerek yok
 
+    if dtype_backend == "pyarrow":
+        ikas_df = _to_arrow_strings(ikas_df)
     return ikas_df
 
 
-if __name__ == "__main__":
-    # Test için örnek Shopify verisi
-    sample_shopify_data = pd.DataFrame(
-        {
-            "Handle": ["cotton-tshirt", "cotton-tshirt", "cotton-tshirt", "linen-shirt"],
-            "Title": ["Cotton T-Shirt", "Cotton T-Shirt", "Cotton T-Shirt", "Linen Shirt"],
-            "Body (HTML)": ["<p>Soft cotton tee</p>", "<p>Soft cotton tee</p>", "<p>Soft cotton tee</p>", "<p>Breathable linen shirt</p>"],
-            "Vendor": ["ComfortWear", "ComfortWear", "ComfortWear", "BreezeLine"],
-            "Type": ["Tops", "Tops", "Tops", "Tops"],
-            "Product Category": ["T-Shirts", "T-Shirts", "T-Shirts", "Shirts"],
-            "Tags": ["casual, summer", "casual, summer", "casual, summer", "formal, summer"],
-            "Published": ["TRUE", "TRUE", "TRUE", "TRUE"],
-            "Option1 Name": ["Size", "Size", "Size", ""],
-            "Option1 Value": ["S", "M", "L", ""],
-            "Option2 Name": ["Color", "Color", "Color", ""],
-            "Option2 Value": ["Blue", "Blue", "Red", ""],
-            "Variant SKU": ["CW-TS-001-S", "CW-TS-001-M", "CW-TS-001-L", "BL-LS-002"],
-            "Variant Barcode": ["1234567890123", "1234567890124", "1234567890125", "9876543210987"],
-            "Variant Price": [199.90, 199.90, 199.90, 349.00],
-            "Compare At Price": [249.90, 249.90, 249.90, 399.00],
-            "Variant Inventory Qty": [10, 25, 15, 12],
-            "SEO Title": ["Cotton T-Shirt", "Cotton T-Shirt", "Cotton T-Shirt", "Linen Shirt"],
-            "SEO Description": ["Soft cotton t-shirt", "Soft cotton t-shirt", "Soft cotton t-shirt", "Breathable linen shirt"],
-            "Created At": ["2024-01-01", "2024-01-01", "2024-01-01", "2024-01-15"],
-            "Google Shopping / Google Product Category": ["Apparel & Accessories > Clothing > Shirts & Tops", "Apparel & Accessories > Clothing > Shirts & Tops", "Apparel & Accessories > Clothing > Shirts & Tops", "Apparel & Accessories > Clothing > Shirts & Tops"],
-            "Image Src": [
-                "https://cdn.example.com/products/cotton-tshirt-1.jpg",
-                "https://cdn.example.com/products/cotton-tshirt-2.jpg",
-                "",
-                "https://cdn.example.com/products/linen-shirt.jpg",
-            ],
-            "Variant Image": [
-                "",
-                "https://cdn.example.com/products/cotton-tshirt-variant.jpg",
-                "",
-                "",
-            ],
-        }
-    )
-
-    # Geçici CSV dosyası oluştur
-    temp_input_path = pathlib.Path("sample_shopify_export.csv")
-    sample_shopify_data.to_csv(temp_input_path, index=False)
+# Demo için örnek Shopify verisi (modül düzeyinde bir kez oluşturulur)
+_SAMPLE_COLUMNS: Dict[str, list] = {
+    "Handle": ["cotton-tshirt", "cotton-tshirt", "cotton-tshirt", "linen-shirt"],
+    "Title": ["Cotton T-Shirt", "Cotton T-Shirt", "Cotton T-Shirt", "Linen Shirt"],
+    "Body (HTML)": ["<p>Soft cotton tee</p>", "<p>Soft cotton tee</p>", "<p>Soft cotton tee</p>", "<p>Breathable linen shirt</p>"],
+    "Vendor": ["ComfortWear", "ComfortWear", "ComfortWear", "BreezeLine"],
+    "Type": ["Tops", "Tops", "Tops", "Tops"],
+    "Product Category": ["T-Shirts", "T-Shirts", "T-Shirts", "Shirts"],
+    "Tags": ["casual, summer", "casual, summer", "casual, summer", "formal, summer"],
+    "Published": ["TRUE", "TRUE", "TRUE", "TRUE"],
+    "Option1 Name": ["Size", "Size", "Size", ""],
+    "Option1 Value": ["S", "M", "L", ""],
+    "Option2 Name": ["Color", "Color", "Color", ""],
+    "Option2 Value": ["Blue", "Blue", "Red", ""],
+    "Variant SKU": ["CW-TS-001-S", "CW-TS-001-M", "CW-TS-001-L", "BL-LS-002"],
+    "Variant Barcode": ["1234567890123", "1234567890124", "1234567890125", "9876543210987"],
+    "Variant Price": [199.90, 199.90, 199.90, 349.00],
+    "Compare At Price": [249.90, 249.90, 249.90, 399.00],
+    "Variant Inventory Qty": [10, 25, 15, 12],
+    "SEO Title": ["Cotton T-Shirt", "Cotton T-Shirt", "Cotton T-Shirt", "Linen Shirt"],
+    "SEO Description": ["Soft cotton t-shirt", "Soft cotton t-shirt", "Soft cotton t-shirt", "Breathable linen shirt"],
+    "Created At": ["2024-01-01", "2024-01-01", "2024-01-01", "2024-01-15"],
+    "Google Shopping / Google Product Category": ["Apparel & Accessories > Clothing > Shirts & Tops", "Apparel & Accessories > Clothing > Shirts & Tops", "Apparel & Accessories > Clothing > Shirts & Tops", "Apparel & Accessories > Clothing > Shirts & Tops"],
+    "Image Src": [
+        "https://cdn.example.com/products/cotton-tshirt-1.jpg",
+        "https://cdn.example.com/products/cotton-tshirt-2.jpg",
+        "",
+        "https://cdn.example.com/products/linen-shirt.jpg",
+    ],
+    "Variant Image": [
+        "",
+        "https://cdn.example.com/products/cotton-tshirt-variant.jpg",
+        "",
+        "",
+    ],
+}
 
-    # Dönüşümü çalıştır
-    converted_df = shopify_to_ikas_converter(str(temp_input_path))
-    print("Converted ikas DataFrame:\n", converted_df)
-    print("\nSütunlar:", converted_df.columns.tolist())
 
-    # Temizlik
-    temp_input_path.unlink(missing_ok=True)
+if __name__ == "__main__":
+    # Copy-on-Write: pandas sütunları paylaşır, sadece gerçekten değiştirilince kopyalar.
+    # Genel bir ayar olduğu için sadece betik olarak çalıştırınca açılır; modülü içe aktaranlar etkilenmez
+    pd.set_option("mode.copy_on_write", True)
+
+    try:
+        import pyarrow as pa
+    except ImportError:  # pragma: no cover - pyarrow opsiyonel
+        sample_shopify_data = pd.DataFrame(_SAMPLE_COLUMNS)
+    else:
+        # Sütunlar doğrudan Arrow dizileri olarak kurulur (object tip çıkarımı ve blok birleştirme kopyası yok);
+        # satırlarda tekrar eden metinler sözlük kodlamasıyla tek kez saklanır
+        repeated_columns = {"Vendor", "Type", "Product Category", "Tags", "Google Shopping / Google Product Category"}
+        sample_table = pa.table(
+            {
+                name: pa.array(values).dictionary_encode() if name in repeated_columns else pa.array(values)
+                for name, values in _SAMPLE_COLUMNS.items()
+            }
+        )
+        sample_shopify_data = sample_table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    # Dönüşümü çalıştır (örnek tablo geçici CSV'ye yazılmadan doğrudan verilir)
+    converted_df = shopify_to_ikas_converter(sample_shopify_data)
+    # Tablonun tamamı yerine ilk satırlar biçimlendirilir ve çıktı tek seferde yazılır
+    sys.stdout.write(
+        "Converted ikas DataFrame:\n"
+        + converted_df.head(20).to_string(max_cols=10, index=False)
+        + "\n\nSütunlar: "
+        + repr(converted_df.columns.tolist())
+        + "\n"
+    )
@@ -0,0 +1,55 @@
+import io
+
+import pandas as pd
+
+from converter import _SAMPLE_COLUMNS, shopify_to_ikas_converter
+
+
+def test_integer_barcodes_of_variant_products_round_trip(tmp_path):
+    # CSV'den okunan barkodlar int64 gelir; çıktıda "….0" olmadan yazılmalı
+    export_path = tmp_path / "sample_shopify_export.csv"
+    pd.DataFrame(_SAMPLE_COLUMNS).to_csv(export_path, index=False)
+
+    converted_df = shopify_to_ikas_converter(export_path)
+
+    assert converted_df["Barkod Listesi"].tolist() == [
+        "1234567890123",
+        "1234567890124",
+        "1234567890125",
+        "9876543210987",
+    ]
+
+
+def test_integer_barcodes_keep_their_type_when_blank_sku_rows_are_skipped():
+    export = (
+        "Handle,Option1 Name,Option1 Value,Variant SKU,Variant Barcode,Variant Price\n"
+        "shirt,Size,S, ,111,5\n"
+        "shirt,Size,S,A,222,6\n"
+        "shirt,Size,M,B,333,7\n"
+    )
+
+    converted_df = shopify_to_ikas_converter(io.BytesIO(export.encode()), suffix=".csv")
+
+    assert converted_df["Barkod Listesi"].tolist() == ["", "222", "333"]
+
+
+def test_integer_fallback_barcodes_round_trip_when_variant_barcode_is_blank():
+    # Boş Variant Barcode float64 okunur; yedek Barcode sütunundaki tam sayılar yine "….0" olmadan gelmeli
+    export = (
+        "Handle,Option1 Name,Option1 Value,Variant SKU,Variant Barcode,Barcode,Variant Price\n"
+        "shirt,Size,S,A,,8690000000001,5\n"
+        "shirt,Size,M,B,,8690000000002,6\n"
+    )
+
+    converted_df = shopify_to_ikas_converter(io.BytesIO(export.encode()), suffix=".csv")
+
+    assert converted_df["Barkod Listesi"].tolist() == ["8690000000001", "8690000000002"]
+
+
+def test_numeric_type_fills_an_empty_product_category_as_is():
+    # Product Category sütunu var ama boş (float64); Type'taki 100 "100.0" olmamalı
+    export = "Handle,Title,Product Category,Type\nshirt,Shirt,,100\n"
+
+    converted_df = shopify_to_ikas_converter(io.BytesIO(export.encode()), suffix=".csv")
+
+    assert converted_df[["Kategoriler"]].to_csv(index=False, lineterminator="\n") == "Kategoriler\n100\n"